@@ -3,7 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 """Implements azure.core.tracing.AbstractSpan to wrap OpenTelemetry spans."""
-from typing import Any, ContextManager, Dict, Optional, Union, Callable, Sequence, cast, List
+from typing import Any, ContextManager, Dict, Mapping, Optional, Union, Callable, Sequence, cast, List
 import warnings
 
 from opentelemetry import context, trace
@@ -286,6 +286,15 @@ class OpenTelemetrySpan(HttpSpanMixin, object):
         key = self._attribute_mappings.get(key, key)
         self.span_instance.set_attribute(key, value)
 
+    def _add_attributes(self, attributes: Mapping[str, Union[str, int]]) -> None:
+        """Add multiple attributes (key value pairs) to the current span in a single call.
+
+        :param attributes: The key value pairs to add
+        :type attributes: Mapping[str, Union[str, int]]
+        """
+        mappings = self._attribute_mappings
+        self.span_instance.set_attributes({mappings.get(key, key): value for key, value in attributes.items()})
+
     def get_trace_parent(self) -> str:
         """Return traceparent string as defined in W3C trace context specification.
 
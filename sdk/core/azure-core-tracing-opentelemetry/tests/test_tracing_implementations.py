@@ -470,6 +470,13 @@ class TestOpentelemetryWrapper:
             assert wrapped_class.span_instance.attributes["test"] == "test2"
             assert parent.attributes["test"] == "test2"
 
+    def test_add_attributes_batched(self, tracing_helper):
+        with tracing_helper.tracer.start_as_current_span("Root") as parent:
+            wrapped_class = OpenTelemetrySpan(span=parent)
+            wrapped_class._add_attributes({"test": "test2", "foo": 1})
+            assert parent.attributes["test"] == "test2"
+            assert parent.attributes["foo"] == 1
+
     def test_set_http_attributes_v1_19_0(self, tracing_helper):
         with tracing_helper.tracer.start_as_current_span("Root", kind=OpenTelemetrySpanKind.CLIENT) as parent:
             wrapped_class = OpenTelemetrySpan(span=parent, schema_version="1.19.0")
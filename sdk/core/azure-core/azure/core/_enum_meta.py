@@ -44,8 +44,11 @@ class CaseInsensitiveEnumMeta(EnumMeta):
     """
 
     def __getitem__(cls, name: str) -> Any:
+        # names are usually upper case already, in which case upper() would only allocate a copy
+        if not name.isupper():
+            name = name.upper()
         # disabling pylint bc of pylint bug https://github.com/PyCQA/astroid/issues/713
-        return super(CaseInsensitiveEnumMeta, cls).__getitem__(name.upper())
+        return super(CaseInsensitiveEnumMeta, cls).__getitem__(name)
 
     def __getattr__(cls, name: str) -> Enum:
         """Return the enum member matching `name`.
@@ -26,9 +26,11 @@
 """Traces network calls using the implementation library from the settings."""
 import logging
 import sys
-import urllib.parse
-from typing import TYPE_CHECKING, Optional, Tuple, TypeVar, Union, Any, Type, Mapping, Dict
-from types import TracebackType
+from collections import ChainMap
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple, TypeVar, Union, Any, Type, Mapping, Dict, cast
+from types import MappingProxyType, TracebackType
+from weakref import WeakKeyDictionary
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from azure.core.pipeline.policies import SansIOHTTPPolicy
@@ -45,6 +47,7 @@ from azure.core.tracing._models import TracingOptions
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span
+    from azure.core.tracing.opentelemetry import OpenTelemetryTracer
 
 HTTPResponseType = TypeVar("HTTPResponseType", HttpResponse, LegacyHttpResponse)
 HTTPRequestType = TypeVar("HTTPRequestType", HttpRequest, LegacyHttpRequest)
@@ -53,6 +56,130 @@ OptExcInfo = Union[ExcInfo, Tuple[None, None, None]]
 
 _LOGGER = logging.getLogger(__name__)
 
+# String forms of the error status codes used for the error.type attribute.
+_ERROR_STATUS_CODES = {code: str(code) for code in range(400, 600)}
+
+# error.type attribute values of exception types, weakly keyed so dynamically created types can be collected.
+_ERROR_TYPE_NAMES: "WeakKeyDictionary[Type[BaseException], str]" = WeakKeyDictionary()
+
+# Shared read-only default for requests without tracing options, to avoid allocating an empty dict per request.
+_EMPTY_TRACING_OPTIONS = cast(TracingOptions, MappingProxyType({}))
+
+# Whether spans of a given type come from a tracing plugin, see _is_plugin_span.
+_PLUGIN_SPAN_TYPES: "WeakKeyDictionary[type, bool]" = WeakKeyDictionary()
+
+# Whether plugin spans of a given type support adding attributes in one call, see _add_plugin_span_attributes.
+_BATCH_ATTRIBUTES_SPAN_TYPES: "WeakKeyDictionary[type, bool]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=128)
+def _parse_authority(authority: str) -> Tuple[Optional[str], Optional[int]]:
+    """Split a URL authority into its host and port.
+
+    The result matches the ``hostname`` and ``port`` of ``urllib.parse.urlparse``, except that an invalid port
+    yields None instead of raising. Results are cached since requests are usually sent to a handful of endpoints.
+
+    :param str authority: The authority (netloc) component of a URL
+    :returns: The lowercased host, or None if empty, and the port, or None if absent or invalid
+    :rtype: tuple[str or None, int or None]
+    """
+    host_port = authority.rpartition("@")[2]
+    if host_port.startswith("["):
+        host, _, port = host_port[1:].partition("]")
+        port = port[1:] if port.startswith(":") else ""
+    else:
+        host, _, port = host_port.partition(":")
+    port_number: Optional[int] = None
+    if port.isdigit() and port.isascii():
+        port_number = int(port)
+        if port_number > 65535:
+            port_number = None
+    return host.lower() or None, port_number
+
+
+def _get_server_address(url: str) -> Tuple[Optional[str], Optional[int]]:
+    """Get the host and port of a URL without the cost of a full ``urllib.parse.urlparse``.
+
+    :param str url: The URL to parse
+    :returns: The host and port of the URL
+    :rtype: tuple[str or None, int or None]
+    """
+    scheme_end = url.find("://")
+    # "://" only ends a scheme when it comes before the path, query and fragment
+    if scheme_end != -1 and not any(delimiter in url[:scheme_end] for delimiter in "/?#"):
+        start = scheme_end + 3
+    elif url.startswith("//"):
+        start = 2
+    else:
+        return None, None
+    end = len(url)
+    for delimiter in "/?#":
+        index = url.find(delimiter, start, end)
+        if index != -1:
+            end = index
+    return _parse_authority(url[start:end])
+
+
+def _get_error_type(exception_type: Type[BaseException]) -> str:
+    """Get the error.type attribute value for an exception type.
+
+    The value is the fully qualified name of the type, without the module for builtins. Names are cached per type
+    since the same few exception types are raised repeatedly.
+
+    :param exception_type: The type of the exception raised
+    :type exception_type: type[BaseException]
+    :returns: The fully qualified name of the exception type
+    :rtype: str
+    """
+    error_type = _ERROR_TYPE_NAMES.get(exception_type)
+    if error_type is None:
+        module = exception_type.__module__ if exception_type.__module__ != "builtins" else ""
+        error_type = f"{module}.{exception_type.__qualname__}" if module else exception_type.__qualname__
+        _ERROR_TYPE_NAMES[exception_type] = error_type
+    return error_type
+
+
+def _is_plugin_span(span: Any) -> bool:
+    """Check whether a span is from a tracing plugin rather than the core tracing library.
+
+    We'll determine if the span is from a plugin or the core tracing library based on the presence of the
+    `set_http_attributes` method. The result is cached per span type.
+
+    :param span: The span to check
+    :type span: any
+    :returns: True if the span is from a tracing plugin, False otherwise
+    :rtype: bool
+    """
+    span_type = type(span)
+    is_plugin = _PLUGIN_SPAN_TYPES.get(span_type)
+    if is_plugin is None:
+        is_plugin = hasattr(span, "set_http_attributes")
+        _PLUGIN_SPAN_TYPES[span_type] = is_plugin
+    return is_plugin
+
+
+def _add_plugin_span_attributes(span: Any, attributes: Mapping[str, Any]) -> None:
+    """Add attributes to a span from a tracing plugin.
+
+    Plugins that provide an `_add_attributes` method get all attributes in a single call, others get one
+    `add_attribute` call per attribute. Support for `_add_attributes` is cached per span type.
+
+    :param span: The plugin span to add attributes to
+    :type span: ~azure.core.tracing.AbstractSpan
+    :param attributes: The attributes to add
+    :type attributes: Mapping[str, Any]
+    """
+    span_type = type(span)
+    supports_batch = _BATCH_ATTRIBUTES_SPAN_TYPES.get(span_type)
+    if supports_batch is None:
+        supports_batch = callable(getattr(span, "_add_attributes", None))
+        _BATCH_ATTRIBUTES_SPAN_TYPES[span_type] = supports_batch
+    if supports_batch:
+        span._add_attributes(attributes)  # pylint: disable=protected-access
+    else:
+        for key, value in attributes.items():
+            span.add_attribute(key, value)
+
 
 def _default_network_span_namer(http_request: HTTPRequestType) -> str:
     """Extract the path to be used as network span name.
@@ -78,6 +205,7 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
 
     TRACING_CONTEXT = "TRACING_CONTEXT"
     _SUPPRESSION_TOKEN = "SUPPRESSION_TOKEN"
+    _SUPPRESSION_TRACER = "_SUPPRESSION_TRACER"
 
     # Current stable HTTP semantic conventions
     _HTTP_RESEND_COUNT = "http.request.resend_count"
@@ -99,6 +227,26 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
         self._network_span_namer = kwargs.get("network_span_namer", _default_network_span_namer)
         self._tracing_attributes = kwargs.get("tracing_attributes", {})
         self._instrumentation_config = instrumentation_config
+        # The setting objects are stable (assignment goes through the descriptor), so bind them once to skip the
+        # descriptor lookup on every request. Calling them still resolves the current value.
+        self._tracing_enabled = settings.tracing_enabled
+        self._tracing_implementation = settings.tracing_implementation
+        self._tracer: Optional["OpenTelemetryTracer"] = None
+
+    def _get_tracer(self) -> Optional["OpenTelemetryTracer"]:
+        """Get the tracer for this policy's instrumentation config, resolving it on first use.
+
+        :returns: The OpenTelemetry tracer, or None if OpenTelemetry is not available.
+        :rtype: ~azure.core.tracing.opentelemetry.OpenTelemetryTracer or None
+        """
+        if self._tracer is None:
+            config = self._instrumentation_config or {}
+            self._tracer = get_tracer(
+                library_name=config.get("library_name"),
+                library_version=config.get("library_version"),
+                attributes=config.get("attributes"),
+            )
+        return self._tracer
 
     def on_request(self, request: PipelineRequest[HTTPRequestType]) -> None:
         """Starts a span for the network call.
@@ -106,68 +254,99 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
         :param request: The PipelineRequest object
         :type request: ~azure.core.pipeline.PipelineRequest
         """
-        ctxt = request.context.options
         try:
-            tracing_options: TracingOptions = ctxt.pop("tracing_options", {})
-            tracing_enabled = settings.tracing_enabled()
+            self._start_span(request)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to start network span.")
 
-            # User can explicitly disable tracing for this request.
-            user_enabled = tracing_options.get("enabled")
-            if user_enabled is False:
-                return
+    def _start_span(self, request: PipelineRequest[HTTPRequestType]) -> None:
+        """Starts a span for the network call, if tracing is enabled for it.
 
-            # If tracing is disabled globally and user didn't explicitly enable it, don't trace.
-            if not tracing_enabled and user_enabled is None:
-                return
+        Exceptions are not handled here; on_request keeps them from failing the request.
 
-            span_impl_type = settings.tracing_implementation()
-            namer = ctxt.pop("network_span_namer", self._network_span_namer)
-            tracing_attributes = ctxt.pop("tracing_attributes", self._tracing_attributes)
-            span_name = namer(request.http_request)
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        ctxt = request.context.options
+        tracing_enabled = self._tracing_enabled()
 
-            span_attributes = {**tracing_attributes, **tracing_options.get("attributes", {})}
+        # Tracing is disabled globally and there are no per-request options to enable it, so there's no work to do.
+        if not tracing_enabled and "tracing_options" not in ctxt:
+            return
 
-            if span_impl_type:
-                # If the plugin is enabled, prioritize it over the core tracing.
-                span = span_impl_type(name=span_name, kind=SpanKind.CLIENT)
-                for attr, value in span_attributes.items():
-                    span.add_attribute(attr, value)  # type: ignore
+        tracing_options: TracingOptions = ctxt.pop("tracing_options", _EMPTY_TRACING_OPTIONS)
 
-                with change_context(span.span_instance):
-                    headers = span.to_header()
-                    request.http_request.headers.update(headers)
-                request.context[self.TRACING_CONTEXT] = span
-            else:
-                # Otherwise, use the core tracing.
-                config = self._instrumentation_config or {}
-                tracer = get_tracer(
-                    library_name=config.get("library_name"),
-                    library_version=config.get("library_version"),
-                    attributes=config.get("attributes"),
-                )
-                if not tracer:
-                    _LOGGER.warning(
-                        "Tracing is enabled, but not able to get an OpenTelemetry tracer. "
-                        "Please ensure that `opentelemetry-api` is installed."
-                    )
-                    return
-
-                otel_span = tracer.start_span(
-                    name=span_name,
-                    kind=SpanKind.CLIENT,
-                    attributes=span_attributes,
-                )
+        # User can explicitly disable tracing for this request.
+        user_enabled = tracing_options.get("enabled")
+        if user_enabled is False:
+            return
 
-                with tracer.use_span(otel_span, end_on_exit=False):
-                    trace_context_headers = tracer.get_trace_context()
-                    request.http_request.headers.update(trace_context_headers)
+        # If tracing is disabled globally and user didn't explicitly enable it, don't trace.
+        if not tracing_enabled and user_enabled is None:
+            return
 
-                request.context[self.TRACING_CONTEXT] = otel_span
-                token = tracer._suppress_auto_http_instrumentation()  # pylint: disable=protected-access
-                request.context[self._SUPPRESSION_TOKEN] = token
+        span_impl_type = self._tracing_implementation()
+        namer = ctxt.pop("network_span_namer", self._network_span_namer)
+        tracing_attributes = ctxt.pop("tracing_attributes", self._tracing_attributes)
+        # Skip the call for the default namer, which is used by nearly all clients.
+        if namer is _default_network_span_namer:
+            span_name = request.http_request.method
+        else:
+            span_name = namer(request.http_request)
 
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.warning("Unable to start network span.")
+        # Avoid merging into a new dict per request. Per-request attributes take precedence when present, and are
+        # used as-is when there are no policy attributes to combine them with. They are never mutated since callers
+        # may reuse them across requests.
+        span_attributes: Mapping[str, Any] = tracing_attributes
+        request_attributes = tracing_options.get("attributes")
+        if request_attributes:
+            span_attributes = (
+                ChainMap(request_attributes, tracing_attributes) if tracing_attributes else request_attributes
+            )
+
+        if span_impl_type:
+            # If the plugin is enabled, prioritize it over the core tracing.
+            span = span_impl_type(name=span_name, kind=SpanKind.CLIENT)
+            if span_attributes:
+                _add_plugin_span_attributes(span, span_attributes)
+
+            # Use the plugin's context manager directly: azure.core.tracing.common.change_context would resolve the
+            # tracing implementation again and wrap it in another generator-based context manager.
+            plugin_change_context = getattr(span_impl_type, "change_context", None) or change_context
+            with plugin_change_context(span.span_instance):
+                headers = span.to_header()
+            request_headers = request.http_request.headers
+            for key, value in headers.items():
+                request_headers[key] = value
+            request.context[self.TRACING_CONTEXT] = span
+        else:
+            # Otherwise, use the core tracing.
+            tracer = self._get_tracer()
+            if not tracer:
+                _LOGGER.warning(
+                    "Tracing is enabled, but not able to get an OpenTelemetry tracer. "
+                    "Please ensure that `opentelemetry-api` is installed."
+                )
+                return
+
+            otel_span = tracer.start_span(
+                name=span_name,
+                kind=SpanKind.CLIENT,
+                attributes=span_attributes,
+            )
+
+            with tracer.use_span(otel_span, end_on_exit=False):
+                trace_context_headers = tracer.get_trace_context()
+            # Request headers are usually a CaseInsensitiveDict, whose MutableMapping.update does an ABC isinstance
+            # check before setting each item, so set the few trace context headers directly.
+            request_headers = request.http_request.headers
+            for key, value in trace_context_headers.items():
+                request_headers[key] = value
+
+            request.context[self.TRACING_CONTEXT] = otel_span
+            token = tracer._suppress_auto_http_instrumentation()  # pylint: disable=protected-access
+            request.context[self._SUPPRESSION_TOKEN] = token
+            request.context[self._SUPPRESSION_TRACER] = tracer
 
     def end_span(
         self,
@@ -193,44 +372,40 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
 
         http_request: Union[HttpRequest, LegacyHttpRequest] = request.http_request
 
-        attributes: Dict[str, Any] = {}
-        if request.context.get("retry_count"):
-            attributes[self._HTTP_RESEND_COUNT] = request.context["retry_count"]
-        if http_request.headers.get(self._REQUEST_ID):
-            attributes[self._REQUEST_ID_ATTR] = http_request.headers[self._REQUEST_ID]
-        if response and self._RESPONSE_ID in response.headers:
-            attributes[self._RESPONSE_ID_ATTR] = response.headers[self._RESPONSE_ID]
-
-        # We'll determine if the span is from a plugin or the core tracing library based on the presence of the
-        # `set_http_attributes` method.
-        if hasattr(span, "set_http_attributes"):
+        if _is_plugin_span(span):
             # Plugin-based tracing
             span.set_http_attributes(request=http_request, response=response)
-            for key, value in attributes.items():
-                span.add_attribute(key, value)
+            attributes: Dict[str, Any] = {}
+            self._add_azure_attributes(attributes, request, response=response)
+            if attributes:
+                _add_plugin_span_attributes(span, attributes)
             if exc_info:
                 span.__exit__(*exc_info)
             else:
                 span.finish()
         else:
             # Native tracing
-            self._set_http_client_span_attributes(span, request=http_request, response=response)
-            span.set_attributes(attributes)
+            # Attributes set on a span that isn't recording (e.g. it was sampled out) are discarded, so don't spend
+            # time assembling them.
+            if span.is_recording():
+                # Collect all attributes in one dict so they're set with a single call.
+                attributes = self._get_http_client_span_attributes(http_request, response=response)
+                self._add_azure_attributes(attributes, request, response=response)
+                if exc_info:
+                    # If there was an exception, set the error.type attribute.
+                    exception_type = exc_info[0]
+                    if exception_type:
+                        attributes[self._ERROR_TYPE] = _get_error_type(exception_type)
+                span.set_attributes(attributes)
             if exc_info:
-                # If there was an exception, set the error.type attribute.
-                exception_type = exc_info[0]
-                if exception_type:
-                    module = exception_type.__module__ if exception_type.__module__ != "builtins" else ""
-                    error_type = f"{module}.{exception_type.__qualname__}" if module else exception_type.__qualname__
-                    span.set_attribute(self._ERROR_TYPE, error_type)
-
                 span.__exit__(*exc_info)
             else:
                 span.end()
 
+        # The tracer that installed the suppression token is kept in the context, so no tracer lookup is needed here.
         suppression_token = request.context.get(self._SUPPRESSION_TOKEN)
         if suppression_token:
-            tracer = get_tracer()
+            tracer = request.context.get(self._SUPPRESSION_TRACER) or self._get_tracer()
             if tracer:
                 tracer._detach_from_context(suppression_token)  # pylint: disable=protected-access
 
@@ -256,38 +431,64 @@ class DistributedTracingPolicy(SansIOHTTPPolicy[HTTPRequestType, HTTPResponseTyp
         """
         self.end_span(request, exc_info=sys.exc_info())
 
-    def _set_http_client_span_attributes(
+    def _add_azure_attributes(
         self,
-        span: "Span",
-        request: Union[HttpRequest, LegacyHttpRequest],
+        attributes: Dict[str, Any],
+        request: PipelineRequest[HTTPRequestType],
         response: Optional[HTTPResponseType] = None,
     ) -> None:
-        """Add attributes to an HTTP client span.
+        """Add the resend count and Azure request id attributes to an attribute dict.
+
+        :param attributes: The attributes to add to.
+        :type attributes: dict[str, Any]
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param response: The response received from the server. Is None if no response received.
+        :type response: ~azure.core.rest.HTTPResponse or ~azure.core.pipeline.transport.HttpResponse
+        """
+        retry_count = request.context.get("retry_count")
+        if retry_count:
+            attributes[self._HTTP_RESEND_COUNT] = retry_count
+        request_id = request.http_request.headers.get(self._REQUEST_ID)
+        if request_id:
+            attributes[self._REQUEST_ID_ATTR] = request_id
+        if response:
+            response_id = response.headers.get(self._RESPONSE_ID)
+            if response_id is not None:
+                attributes[self._RESPONSE_ID_ATTR] = response_id
+
+    def _get_http_client_span_attributes(
+        self,
+        request: Union[HttpRequest, LegacyHttpRequest],
+        response: Optional[HTTPResponseType] = None,
+    ) -> Dict[str, Any]:
+        """Get the attributes for an HTTP client span.
 
-        :param span: The span to add attributes to.
-        :type span: ~opentelemetry.trace.Span
         :param request: The request made
         :type request: ~azure.core.rest.HttpRequest
         :param response: The response received from the server. Is None if no response received.
         :type response: ~azure.core.rest.HTTPResponse or ~azure.core.pipeline.transport.HttpResponse
+        :returns: The HTTP client span attributes
+        :rtype: dict[str, Any]
         """
         attributes: Dict[str, Any] = {
             self._HTTP_REQUEST_METHOD: request.method,
             self._URL_FULL: request.url,
         }
 
-        parsed_url = urllib.parse.urlparse(request.url)
-        if parsed_url.hostname:
-            attributes[self._SERVER_ADDRESS] = parsed_url.hostname
-        if parsed_url.port:
-            attributes[self._SERVER_PORT] = parsed_url.port
+        host, port = _get_server_address(request.url)
+        if host:
+            attributes[self._SERVER_ADDRESS] = host
+        if port:
+            attributes[self._SERVER_PORT] = port
 
         user_agent = request.headers.get("User-Agent")
         if user_agent:
             attributes[self._USER_AGENT_ORIGINAL] = user_agent
-        if response and response.status_code:
-            attributes[self._HTTP_RESPONSE_STATUS_CODE] = response.status_code
-            if response.status_code >= 400:
-                attributes[self._ERROR_TYPE] = str(response.status_code)
+        status_code = response.status_code if response else 0
+        if status_code:
+            attributes[self._HTTP_RESPONSE_STATUS_CODE] = status_code
+            if status_code >= 400:
+                attributes[self._ERROR_TYPE] = _ERROR_STATUS_CODES.get(status_code) or str(status_code)
 
-        span.set_attributes(attributes)
+        return attributes
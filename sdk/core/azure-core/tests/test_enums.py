@@ -25,6 +25,8 @@
 # --------------------------------------------------------------------------
 from enum import Enum
 
+import pytest
+
 from azure.core import CaseInsensitiveEnumMeta
 
 
@@ -42,3 +44,18 @@ def test_case_insensitive_enums():
     assert MyCustomEnum["foo"] == "foo"
     assert MyCustomEnum["FOO"] == "foo"
     assert isinstance(MyCustomEnum.BAR, str)
+
+
+def test_case_insensitive_enums_getitem():
+    class MixedCaseEnum(str, Enum, metaclass=CaseInsensitiveEnumMeta):
+        FOO = "foo"
+        Bar = "bar"
+
+    assert MyCustomEnum["FOO"] is MyCustomEnum.FOO
+    assert MyCustomEnum["Bar"] is MyCustomEnum.BAR
+    assert MixedCaseEnum["foo"] is MixedCaseEnum.FOO
+    # lookups are by the upper-cased name, so a member whose name isn't upper case can't be indexed
+    with pytest.raises(KeyError):
+        MixedCaseEnum["Bar"]
+    with pytest.raises(KeyError):
+        MyCustomEnum["baz"]
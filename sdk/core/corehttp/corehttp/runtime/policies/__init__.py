@@ -24,12 +24,14 @@
 #
 # --------------------------------------------------------------------------
 
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
 from ._base import HTTPPolicy, SansIOHTTPPolicy, RequestHistory
 from ._authentication import (
     BearerTokenCredentialPolicy,
     ServiceKeyCredentialPolicy,
 )
-from ._distributed_tracing import DistributedHttpTracingPolicy
 from ._retry import RetryPolicy, RetryMode
 from ._universal import (
     HeadersPolicy,
@@ -39,9 +41,32 @@ from ._universal import (
     ProxyPolicy,
 )
 from ._base_async import AsyncHTTPPolicy
-from ._authentication_async import AsyncBearerTokenCredentialPolicy
 from ._retry_async import AsyncRetryPolicy
 
+if TYPE_CHECKING:
+    from ._authentication_async import AsyncBearerTokenCredentialPolicy
+    from ._distributed_tracing import DistributedHttpTracingPolicy
+
+# Policies whose modules are only imported on first access, since not every consumer needs them (PEP 562).
+_LAZY_IMPORTS = {
+    "AsyncBearerTokenCredentialPolicy": "._authentication_async",
+    "DistributedHttpTracingPolicy": "._distributed_tracing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "HTTPPolicy",
     "SansIOHTTPPolicy",
@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 
 import collections
+import itertools
 import logging
 import os
 import random
@@ -34,6 +35,9 @@ except:
 
 SPLIT_TIMEOUT = 60*10  # timeout test at 10 minutes
 SLEEP_TIME = 30  # sleep for 30 seconds
+# unique per test run; get_test_items numbers its items from this prefix
+_TEST_ITEM_RUN_ID = uuid.uuid4().hex
+_TEST_ITEM_COUNTER = itertools.count()
 
 class TestConfig(object):
     local_host = 'https://localhost:8081/'
@@ -318,6 +322,16 @@ def get_test_item():
     }
     return test_item
 
+def get_test_items(num_items):
+    """Build num_items test items, drawing all attr1 values up front."""
+    attrs = random.choices(range(11), k=num_items)
+    return [{
+        'id': 'Item_{}_{}'.format(_TEST_ITEM_RUN_ID, next(_TEST_ITEM_COUNTER)),
+        'test_object': True,
+        'lastName': 'Smith',
+        'attr1': attr
+    } for attr in attrs]
+
 def pre_split_hook(response):
     request_headers = response.http_request.headers
     session_token = request_headers.get('x-ms-session-token')
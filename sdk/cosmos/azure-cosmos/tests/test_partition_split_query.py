@@ -16,18 +16,16 @@ from azure.cosmos.exceptions import CosmosHttpResponseError
 
 def run_queries(container, iterations):
     ret_list = []
+    query = 'SELECT * FROM c WHERE c.attr1=@attr1 order by c.attr1'
     for i in range(iterations):
-        curr = str(random.randint(0, 10))
-        query = 'SELECT * FROM c WHERE c.attr1=' + curr + ' order by c.attr1'
-        qlist = list(container.query_items(query=query, enable_cross_partition_query=True))
+        curr = random.randint(0, 10)
+        qlist = list(container.query_items(query=query, parameters=[{"name": "@attr1", "value": curr}],
+                                           enable_cross_partition_query=True))
         ret_list.append((curr, qlist))
-    for ret in ret_list:
-        curr = ret[0]
-        if len(ret[1]) != 0:
-            for results in ret[1]:
-                attr_number = results['attr1']
-                assert str(attr_number) == curr  # verify that all results match their randomly generated attributes
-        print("validation succeeded for all query results")
+    for curr, qlist in ret_list:
+        # verify that all results match their randomly generated attributes
+        assert all(results['attr1'] == curr for results in qlist)
+    print("validation succeeded for all query results")
 
 
 @pytest.mark.cosmosSplit
@@ -62,8 +60,7 @@ class TestPartitionSplitQuery(unittest.TestCase):
             pass
 
     def test_partition_split_query(self):
-        for i in range(100):
-            body = test_config.get_test_item()
+        for body in test_config.get_test_items(100):
             self.container.create_item(body=body)
 
         start_time = time.time()
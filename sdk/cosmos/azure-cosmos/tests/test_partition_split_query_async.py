@@ -1,6 +1,8 @@
 # The MIT License (MIT)
 # Copyright (c) Microsoft Corporation. All rights reserved.
 
+import asyncio
+import sys
 import time
 import unittest
 import random
@@ -10,21 +12,36 @@ import pytest
 import test_config
 from azure.cosmos import PartitionKey
 from azure.cosmos.aio import CosmosClient, DatabaseProxy, ContainerProxy
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+async def create_items(container, num_items, concurrency=32):
+    """Create test items concurrently, with at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create_item(body):
+        async with semaphore:
+            return await container.create_item(body=body)
+
+    bodies = test_config.get_test_items(num_items)
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(create_item(body)) for body in bodies]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*[create_item(body) for body in bodies])
+
 
 async def run_queries(container, iterations):
     ret_list = []
+    query = 'SELECT * FROM c WHERE c.attr1=@attr1 order by c.attr1'
+    query_items = container.query_items
     for i in range(iterations):
-        curr = str(random.randint(0, 10))
-        query = 'SELECT * FROM c WHERE c.attr1=' + curr + ' order by c.attr1'
-        qlist = [item async for item in container.query_items(query=query)]
+        curr = random.randint(0, 10)
+        qlist = [item async for item in query_items(query=query, parameters=[{"name": "@attr1", "value": curr}])]
         ret_list.append((curr, qlist))
-    for ret in ret_list:
-        curr = ret[0]
-        if len(ret[1]) != 0:
-            for results in ret[1]:
-                attr_number = results['attr1']
-                assert str(attr_number) == curr  # verify that all results match their randomly generated attributes
-        print("validation succeeded for all query results")
+    for curr, qlist in ret_list:
+        # verify that all results match their randomly generated attributes
+        assert all(results['attr1'] == curr for results in qlist)
+    print("validation succeeded for all query results")
 
 
 @pytest.mark.cosmosSplit
@@ -59,12 +76,15 @@ class TestPartitionSplitQueryAsync(unittest.IsolatedAsyncioTestCase):
             offer_throughput=self.throughput)
 
     async def asyncTearDown(self):
-        await self.client.close()
+        try:
+            await self.created_database.delete_container(self.container.id)
+        except CosmosHttpResponseError:
+            pass
+        finally:
+            await self.client.close()
 
     async def test_partition_split_query_async(self):
-        for i in range(100):
-            body = test_config.get_test_item()
-            await self.container.create_item(body=body)
+        await create_items(self.container, 100)
 
         start_time = time.time()
         print("created items, changing offer to 11k and starting queries")
@@ -81,7 +101,7 @@ class TestPartitionSplitQueryAsync(unittest.IsolatedAsyncioTestCase):
             if time.time() - start_time > self.MAX_TIME:  # timeout test at 10 minutes
                 self.skipTest("Partition split didn't complete in time.")
             if offer.properties['content'].get('isOfferReplacePending', False):
-                time.sleep(30)  # wait for the offer to be replaced, check every 30 seconds
+                await asyncio.sleep(30)  # wait for the offer to be replaced, check every 30 seconds
                 offer = await self.container.get_throughput()
             else:
                 print("offer replaced successfully, took around {} seconds".format(time.time() - offer_time))
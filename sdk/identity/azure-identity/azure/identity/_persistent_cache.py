@@ -2,10 +2,11 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import functools
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from ._constants import CACHE_CAE_SUFFIX, CACHE_NON_CAE_SUFFIX
 
@@ -83,35 +84,70 @@ def _get_persistence(
     :return: an msal_extensions persistence instance
     :rtype: ~msal_extensions.persistence.BasePersistence
     """
+    platform = _get_platform_family(sys.platform)
+    if platform == "win":
+        return _get_windows_persistence(cache_name)
+    if platform == "darwin":
+        return _get_macos_persistence(cache_name, account_name)
+    if platform == "linux":
+        return _get_linux_persistence(cache_name, account_name, allow_unencrypted)
+    raise NotImplementedError("A persistent cache is not available in this environment.")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_platform_family(platform: str) -> Optional[str]:
+    """Get the family of a platform, so that its prefix is matched once rather than on every call.
+
+    :param str platform: the value of sys.platform
+    :return: "win", "darwin" or "linux", or None when the platform doesn't support a persistent cache
+    :rtype: str or None
+    """
+    for family in ("win", "darwin", "linux"):
+        if platform.startswith(family):
+            return family
+    return None
+
+
+def _get_windows_persistence(cache_name: str) -> "msal_extensions.persistence.BasePersistence":
+    """Get a persistence that stores the cache in a file protected by the Data Protection API."""
     import msal_extensions
 
-    if sys.platform.startswith("win") and "LOCALAPPDATA" in os.environ:
-        cache_location = os.path.join(os.environ["LOCALAPPDATA"], ".IdentityService", cache_name)
-        return msal_extensions.FilePersistenceWithDataProtection(cache_location)
-
-    if sys.platform.startswith("darwin"):
-        # the cache uses this file's modified timestamp to decide whether to reload
-        file_path = os.path.expanduser(os.path.join("~", ".IdentityService", cache_name))
-        return msal_extensions.KeychainPersistence(file_path, "Microsoft.Developer.IdentityService", account_name)
-
-    if sys.platform.startswith("linux"):
-        # The cache uses this file's modified timestamp to decide whether to reload. Note this path is the same
-        # as that of the plaintext fallback: a new encrypted cache will stomp an unencrypted cache.
-        file_path = os.path.expanduser(os.path.join("~", ".IdentityService", cache_name))
-        try:
-            return msal_extensions.LibsecretPersistence(
-                file_path, cache_name, {"MsalClientID": "Microsoft.Developer.IdentityService"}, label=account_name
-            )
-        except Exception as ex:  # pylint:disable=broad-except
-            _LOGGER.debug('msal-extensions is unable to encrypt a persistent cache: "%s"', ex, exc_info=True)
-            if not allow_unencrypted:
-                error = ValueError(
-                    "Cache encryption is impossible because libsecret dependencies are not installed or are unusable,"
-                    + " for example because no display is available (as in an SSH session). The chained exception has"
-                    + ' more information. Specify "allow_unencrypted_storage=True" to store the cache unencrypted'
-                    + " instead of raising this exception."
-                )
-                raise error from ex
-        return msal_extensions.FilePersistence(file_path)
+    if "LOCALAPPDATA" not in os.environ:
+        raise NotImplementedError("A persistent cache is not available in this environment.")
+    cache_location = os.path.join(os.environ["LOCALAPPDATA"], ".IdentityService", cache_name)
+    return msal_extensions.FilePersistenceWithDataProtection(cache_location)
 
-    raise NotImplementedError("A persistent cache is not available in this environment.")
+
+def _get_macos_persistence(cache_name: str, account_name: str) -> "msal_extensions.persistence.BasePersistence":
+    """Get a persistence that stores the cache in the Keychain."""
+    import msal_extensions
+
+    # the cache uses this file's modified timestamp to decide whether to reload
+    file_path = os.path.expanduser(os.path.join("~", ".IdentityService", cache_name))
+    return msal_extensions.KeychainPersistence(file_path, "Microsoft.Developer.IdentityService", account_name)
+
+
+def _get_linux_persistence(
+    cache_name: str, account_name: str, allow_unencrypted: bool
+) -> "msal_extensions.persistence.BasePersistence":
+    """Get a persistence that stores the cache with libsecret, or in a plaintext file when that's allowed."""
+    import msal_extensions
+
+    # The cache uses this file's modified timestamp to decide whether to reload. Note this path is the same
+    # as that of the plaintext fallback: a new encrypted cache will stomp an unencrypted cache.
+    file_path = os.path.expanduser(os.path.join("~", ".IdentityService", cache_name))
+    try:
+        return msal_extensions.LibsecretPersistence(
+            file_path, cache_name, {"MsalClientID": "Microsoft.Developer.IdentityService"}, label=account_name
+        )
+    except Exception as ex:  # pylint:disable=broad-except
+        _LOGGER.debug('msal-extensions is unable to encrypt a persistent cache: "%s"', ex, exc_info=True)
+        if not allow_unencrypted:
+            error = ValueError(
+                "Cache encryption is impossible because libsecret dependencies are not installed or are unusable,"
+                + " for example because no display is available (as in an SSH session). The chained exception has"
+                + ' more information. Specify "allow_unencrypted_storage=True" to store the cache unencrypted'
+                + " instead of raising this exception."
+            )
+            raise error from ex
+    return msal_extensions.FilePersistence(file_path)
@@ -4,6 +4,7 @@
 # -------------------------------------
 from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 
 from ._enums import KeyOperation, KeyRotationPolicyAction, KeyType
@@ -13,10 +14,15 @@ from ._generated.models import JsonWebKey as _JsonWebKey
 if TYPE_CHECKING:
     from ._generated import models as _models
 
+# Pages and rebuilt models (e.g. KeyVaultKey and then DeletedKey for one bundle) parse the same IDs repeatedly. The
+# parsed KeyVaultResourceId is only ever read by the models, so instances can safely be shared.
+_parse_key_id = lru_cache(maxsize=4096)(parse_key_vault_id)
+
+
 KeyOperationResult = namedtuple("KeyOperationResult", ["id", "value"])
 
 
-class JsonWebKey(object):
+class JsonWebKey(object):  # pylint:disable=too-many-instance-attributes
     """As defined in http://tools.ietf.org/html/draft-ietf-jose-json-web-key-18. All parameters are optional.
 
     :keyword str kid: Key identifier.
@@ -41,16 +47,67 @@ class JsonWebKey(object):
     """
 
     _FIELDS = ("kid", "kty", "key_ops", "n", "e", "d", "dp", "dq", "qi", "p", "q", "k", "t", "crv", "x", "y")
+    _FIELDS_SET = frozenset(_FIELDS)
 
     def __init__(self, **kwargs: Any) -> None:
-        for field in self._FIELDS:
-            setattr(self, field, kwargs.get(field))
+        self.kid = kwargs.get("kid")
+        self.kty = kwargs.get("kty")
+        self.key_ops = kwargs.get("key_ops")
+        self.n = kwargs.get("n")
+        self.e = kwargs.get("e")
+        self.d = kwargs.get("d")
+        self.dp = kwargs.get("dp")
+        self.dq = kwargs.get("dq")
+        self.qi = kwargs.get("qi")
+        self.p = kwargs.get("p")
+        self.q = kwargs.get("q")
+        self.k = kwargs.get("k")
+        self.t = kwargs.get("t")
+        self.crv = kwargs.get("crv")
+        self.x = kwargs.get("x")
+        self.y = kwargs.get("y")
+
+    @classmethod
+    def _from_generated(cls, jwk: _JsonWebKey) -> "JsonWebKey":
+        # assign the fields directly rather than round-tripping them through a kwargs dict
+        key = cls.__new__(cls)
+        key.kid = jwk.kid
+        key.kty = jwk.kty
+        key.key_ops = jwk.key_ops
+        key.n = jwk.n
+        key.e = jwk.e
+        key.d = jwk.d
+        key.dp = jwk.dp
+        key.dq = jwk.dq
+        key.qi = jwk.qi
+        key.p = jwk.p
+        key.q = jwk.q
+        key.k = jwk.k
+        key.t = jwk.t
+        key.crv = jwk.crv
+        key.x = jwk.x
+        key.y = jwk.y
+        return key
 
     def _to_generated_model(self) -> _JsonWebKey:
-        jwk = _JsonWebKey()
-        for field in self._FIELDS:
-            setattr(jwk, field, getattr(self, field))
-        return jwk
+        return _JsonWebKey(
+            kid=self.kid,
+            kty=self.kty,
+            key_ops=self.key_ops,
+            n=self.n,
+            e=self.e,
+            d=self.d,
+            dp=self.dp,
+            dq=self.dq,
+            qi=self.qi,
+            p=self.p,
+            q=self.q,
+            k=self.k,
+            t=self.t,
+            crv=self.crv,
+            x=self.x,
+            y=self.y,
+        )
 
 
 class KeyAttestation:
@@ -107,29 +164,36 @@ class KeyProperties(object):
     :paramtype release_policy: ~azure.keyvault.keys.KeyReleasePolicy or None
     """
 
-    def __init__(self, key_id: str, attributes: "Optional[_models.KeyAttributes]" = None, **kwargs: Any) -> None:
+    def __init__(  # pylint:disable=unused-argument
+        self,
+        key_id: str,
+        attributes: "Optional[_models.KeyAttributes]" = None,
+        *,
+        managed: Optional[bool] = None,
+        tags: Optional[Dict[str, str]] = None,
+        release_policy: "Optional[KeyReleasePolicy]" = None,
+        **kwargs: Any,
+    ) -> None:
         self._attributes = attributes
         self._id = key_id
-        self._vault_id = KeyVaultKeyIdentifier(key_id)
-        self._managed = kwargs.get("managed", None)
-        self._tags = kwargs.get("tags", None)
-        self._release_policy = kwargs.pop("release_policy", None)
+        self._vault_id = _parse_key_id(key_id)
+        self._managed = managed
+        self._tags = tags
+        self._release_policy = release_policy
+        self._attestation: Optional[KeyAttestation] = None
 
     def __repr__(self) -> str:
         return f"<KeyProperties [{self.id}]>"[:1024]
 
     @classmethod
     def _from_key_bundle(cls, key_bundle: Union["_models.KeyBundle", "_models.DeletedKeyBundle"]) -> "KeyProperties":
-        # pylint:disable=line-too-long
-        # release_policy was added in 7.3-preview
         release_policy = None
-        if (
-            hasattr(key_bundle, "release_policy") and key_bundle.release_policy is not None  # type: ignore[attr-defined]
-        ):
+        generated_policy = key_bundle.release_policy
+        if generated_policy is not None:
             release_policy = KeyReleasePolicy(
-                encoded_policy=key_bundle.release_policy.encoded_policy,  # type: ignore
-                content_type=key_bundle.release_policy.content_type,  # type: ignore[attr-defined]
-                immutable=key_bundle.release_policy.immutable,  # type: ignore[attr-defined]
+                encoded_policy=generated_policy.encoded_policy,  # type: ignore
+                content_type=generated_policy.content_type,
+                immutable=generated_policy.immutable,
             )
 
         return cls(
@@ -237,10 +301,7 @@ class KeyProperties(object):
         :returns: The number of days the key is retained before being deleted from a soft-delete enabled Key Vault.
         :rtype: int or None
         """
-        # recoverable_days was added in 7.1-preview
-        if self._attributes:
-            return getattr(self._attributes, "recoverable_days", None)
-        return None
+        return self._attributes.recoverable_days if self._attributes else None
 
     @property
     def recovery_level(self) -> Optional[str]:
@@ -276,10 +337,7 @@ class KeyProperties(object):
         :returns: True if the private key can be exported; False otherwise.
         :rtype: bool or None
         """
-        # exportable was added in 7.3-preview
-        if self._attributes:
-            return getattr(self._attributes, "exportable", None)
-        return None
+        return self._attributes.exportable if self._attributes else None
 
     @property
     def release_policy(self) -> "Optional[KeyReleasePolicy]":
@@ -297,10 +355,7 @@ class KeyProperties(object):
         :returns: The underlying HSM platform.
         :rtype: str or None
         """
-        # hsm_platform was added in 7.5-preview.1
-        if self._attributes:
-            return getattr(self._attributes, "hsm_platform", None)
-        return None
+        return self._attributes.hsm_platform if self._attributes else None
 
     @property
     def attestation(self) -> Optional[KeyAttestation]:
@@ -309,11 +364,12 @@ class KeyProperties(object):
         :returns: The key or key version attestation information.
         :rtype: ~azure.keyvault.keys.KeyAttestation or None
         """
-        # attestation was added in 7.6-preview.2
-        if self._attributes:
-            attestation = getattr(self._attributes, "attestation", None)
-            return KeyAttestation._from_generated(attestation=attestation) if attestation else None  # pylint:disable=protected-access
-        return None
+        if self._attestation is None and self._attributes:
+            attestation = self._attributes.attestation
+            if attestation:
+                # pylint:disable=protected-access
+                self._attestation = KeyAttestation._from_generated(attestation=attestation)
+        return self._attestation
 
 
 class KeyReleasePolicy(object):
@@ -461,7 +517,7 @@ class KeyVaultKey(object):
     def __init__(self, key_id: str, jwk: Optional[Dict[str, Any]] = None, **kwargs) -> None:
         self._properties: KeyProperties = kwargs.pop("properties", None) or KeyProperties(key_id, **kwargs)
         if isinstance(jwk, dict):
-            if any(field in kwargs for field in JsonWebKey._FIELDS):
+            if not JsonWebKey._FIELDS_SET.isdisjoint(kwargs):
                 raise ValueError(
                     "Individual keyword arguments for key material and the 'jwk' argument are mutually exclusive."
                 )
@@ -475,11 +531,11 @@ class KeyVaultKey(object):
     @classmethod
     def _from_key_bundle(cls, key_bundle: "_models.KeyBundle") -> "KeyVaultKey":
         # pylint:disable=protected-access
-        return cls(
-            key_id=key_bundle.key.kid,  # type: ignore
-            jwk={field: getattr(key_bundle.key, field, None) for field in JsonWebKey._FIELDS},
-            properties=KeyProperties._from_key_bundle(key_bundle),
-        )
+        # the bundle already carries everything __init__ would build, so populate the slots directly
+        key = cls.__new__(cls)
+        key._properties = KeyProperties._from_key_bundle(key_bundle)
+        key._key_material = JsonWebKey._from_generated(key_bundle.key)  # type: ignore
+        return key
 
     @property
     def id(self) -> str:
@@ -555,7 +611,7 @@ class KeyVaultKeyIdentifier(object):
     """
 
     def __init__(self, source_id: str) -> None:
-        self._resource_id = parse_key_vault_id(source_id)
+        self._resource_id = _parse_key_id(source_id)
 
     @property
     def source_id(self) -> str:
@@ -609,14 +665,13 @@ class DeletedKey(KeyVaultKey):
     @classmethod
     def _from_deleted_key_bundle(cls, deleted_key_bundle: "_models.DeletedKeyBundle") -> "DeletedKey":
         # pylint:disable=protected-access
-        return cls(
-            properties=KeyProperties._from_key_bundle(deleted_key_bundle),
-            key_id=deleted_key_bundle.key.kid,  # type: ignore
-            jwk={field: getattr(deleted_key_bundle.key, field, None) for field in JsonWebKey._FIELDS},
-            deleted_date=deleted_key_bundle.deleted_date,
-            recovery_id=deleted_key_bundle.recovery_id,
-            scheduled_purge_date=deleted_key_bundle.scheduled_purge_date,
-        )
+        deleted_key = cls.__new__(cls)
+        deleted_key._properties = KeyProperties._from_key_bundle(deleted_key_bundle)
+        deleted_key._key_material = JsonWebKey._from_generated(deleted_key_bundle.key)  # type: ignore
+        deleted_key._deleted_date = deleted_key_bundle.deleted_date
+        deleted_key._recovery_id = deleted_key_bundle.recovery_id
+        deleted_key._scheduled_purge_date = deleted_key_bundle.scheduled_purge_date
+        return deleted_key
 
     @classmethod
     def _from_deleted_key_item(cls, deleted_key_item: "_models.DeletedKeyItem") -> "DeletedKey":
@@ -0,0 +1,80 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+from collections import OrderedDict
+from copy import deepcopy
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from ._models import KeyVaultSecret
+
+
+class SecretCache:
+    """A bounded, thread-safe LRU cache of secrets, keyed by name and version, whose entries expire after a TTL.
+
+    The cache holds its own copy of each secret and hands out a fresh copy on every hit, so callers can't see each
+    other's changes to a returned secret.
+
+    :param float ttl: Seconds for which a cached secret is returned before it must be fetched again.
+    :param int maxsize: The maximum number of secrets to hold. The least recently used entry is evicted first.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        if ttl <= 0:
+            raise ValueError("cache_ttl must be greater than 0")
+        if maxsize < 1:
+            raise ValueError("cache_maxsize must be at least 1")
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, KeyVaultSecret]]" = OrderedDict()
+        # bumped by invalidate so that a fetch which began before a write can't cache what it read
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, name: str) -> int:
+        """Get the secret's current generation. Pass it to :func:`set` along with the secret fetched afterwards.
+
+        :param str name: Name of the secret
+
+        :returns: The generation of the secret's cache entries.
+        :rtype: int
+        """
+        with self._lock:
+            return self._generations.get(name, 0)
+
+    def get(self, name: str, version: Optional[str]) -> Optional[KeyVaultSecret]:
+        key = (name, version or "")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            secret = entry[1]
+        return deepcopy(secret)
+
+    def set(self, name: str, version: Optional[str], secret: KeyVaultSecret, generation: int) -> None:
+        key = (name, version or "")
+        secret = deepcopy(secret)
+        with self._lock:
+            if self._generations.get(name, 0) != generation:
+                # the secret was written or deleted while it was being fetched; what was read may be stale
+                return
+            self._entries[key] = (time.monotonic() + self._ttl, secret)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, name: str) -> None:
+        """Drop every cached version of a secret, and keep fetches already in flight from caching it again.
+
+        :param str name: Name of the secret
+        """
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
@@ -2,14 +2,18 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+from concurrent import futures
 from datetime import datetime
 from functools import partial
-from typing import Any, cast, Dict, Optional
+from typing import Any, cast, Dict, Iterable, List, Optional
 
+from azure.core.credentials import TokenCredential
 from azure.core.paging import ItemPaged
 from azure.core.polling import LROPoller
+from azure.core.tracing.common import with_current_context
 from azure.core.tracing.decorator import distributed_trace
 
+from ._cache import SecretCache
 from ._models import KeyVaultSecret, DeletedSecret, SecretProperties
 from ._shared import KeyVaultClientBase
 from ._shared._polling import DeleteRecoverPollingMethod, KeyVaultOperationPoller
@@ -29,6 +33,10 @@ class SecretClient(KeyVaultClientBase):
     :paramtype api_version: ~azure.keyvault.secrets.ApiVersion or str
     :keyword bool verify_challenge_resource: Whether to verify the authentication challenge resource matches the Key
         Vault domain. Defaults to True.
+    :keyword float cache_ttl: Seconds for which :func:`get_secret` may return a secret it fetched earlier instead of
+        sending a new request. Caching is disabled unless this is set. Secrets this client sets, updates, deletes,
+        restores or recovers are evicted immediately; changes made elsewhere are seen once the TTL lapses.
+    :keyword int cache_maxsize: The maximum number of secrets to cache when ``cache_ttl`` is set. Defaults to 256.
 
     Example:
         .. literalinclude:: ../tests/test_samples_secrets.py
@@ -41,6 +49,18 @@ class SecretClient(KeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    def __init__(
+        self,
+        vault_url: str,
+        credential: TokenCredential,
+        *,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 256,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(vault_url, credential, **kwargs)
+        self._cache = SecretCache(cache_ttl, cache_maxsize) if cache_ttl is not None else None
+
     @distributed_trace
     def get_secret(self, name: str, version: Optional[str] = None, **kwargs: Any) -> KeyVaultSecret:
         """Get a secret. Requires the secrets/get permission.
@@ -62,12 +82,55 @@ class SecretClient(KeyVaultClientBase):
                 :caption: Get a secret
                 :dedent: 8
         """
+        generation = 0
+        if self._cache:
+            cached = self._cache.get(name, version)
+            if cached:
+                return cached
+            generation = self._cache.generation(name)
+
         bundle = self._client.get_secret(
             secret_name=name,
             secret_version=version or "",
             **kwargs
         )
-        return KeyVaultSecret._from_secret_bundle(bundle)
+        secret = KeyVaultSecret._from_secret_bundle(bundle)
+        if self._cache:
+            self._cache.set(name, version, secret, generation)
+        return secret
+
+    @distributed_trace
+    def get_secrets(
+        self, names: Iterable[str], *, max_concurrency: int = 16, **kwargs: Any
+    ) -> List[KeyVaultSecret]:
+        """Get the latest version of several secrets, sending up to ``max_concurrency`` requests at a time. Requires
+        the secrets/get permission.
+
+        :param names: The names of the secrets to get
+        :type names: Iterable[str]
+
+        :keyword int max_concurrency: The maximum number of requests to have in flight at once. Defaults to 16.
+
+        :returns: The fetched secrets, in the order of ``names``.
+        :rtype: list[~azure.keyvault.secrets.KeyVaultSecret]
+
+        :raises ~azure.core.exceptions.ResourceNotFoundError or ~azure.core.exceptions.HttpResponseError:
+            the former if any of the secrets doesn't exist; the latter for other errors
+        :raises ValueError: if ``max_concurrency`` is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        get_secret = with_current_context(partial(self.get_secret, **kwargs))
+        executor = futures.ThreadPoolExecutor(max_concurrency)
+        try:
+            secrets = list(executor.map(get_secret, names))
+        except BaseException:
+            # don't wait for, or start, the remaining lookups after the first failure
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return secrets
 
     @distributed_trace
     def set_secret(
@@ -129,6 +192,8 @@ class SecretClient(KeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        if self._cache:
+            self._cache.invalidate(name)
         return KeyVaultSecret._from_secret_bundle(bundle)
 
     @distributed_trace
@@ -193,6 +258,8 @@ class SecretClient(KeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        if self._cache:
+            self._cache.invalidate(name)
         return SecretProperties._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     @distributed_trace
@@ -295,7 +362,10 @@ class SecretClient(KeyVaultClientBase):
             parameters=self._models.SecretRestoreParameters(secret_bundle_backup=backup),
             **kwargs
         )
-        return SecretProperties._from_secret_bundle(bundle)
+        properties = SecretProperties._from_secret_bundle(bundle)
+        if self._cache:
+            self._cache.invalidate(properties.name)
+        return properties
 
     @distributed_trace
     def begin_delete_secret(self, name: str, **kwargs: Any) -> LROPoller[DeletedSecret]:  # pylint:disable=bad-option-value,delete-operation-wrong-return-type
@@ -335,6 +405,8 @@ class SecretClient(KeyVaultClientBase):
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
         deleted_secret = DeletedSecret._from_deleted_secret_bundle(deleted_secret_bundle)
+        if self._cache:
+            self._cache.invalidate(name)
 
         command = partial(self.get_deleted_secret, name=name, **kwargs)
         polling_method = DeleteRecoverPollingMethod(
@@ -462,6 +534,8 @@ class SecretClient(KeyVaultClientBase):
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
         recovered_secret = SecretProperties._from_secret_bundle(recovered_secret_bundle)
+        if self._cache:
+            self._cache.invalidate(name)
 
         command = partial(self.get_secret, name=name, **kwargs)
         polling_method = DeleteRecoverPollingMethod(
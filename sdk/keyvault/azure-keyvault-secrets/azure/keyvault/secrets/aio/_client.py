@@ -2,14 +2,17 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
 from datetime import datetime
-from typing import Any, cast, Dict, Optional
+from typing import Any, cast, Dict, Iterable, List, Optional
 from functools import partial
 
+from azure.core.credentials_async import AsyncTokenCredential
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.decorator_async import distributed_trace_async
 from azure.core.async_paging import AsyncItemPaged
 
+from .._cache import SecretCache
 from .._models import KeyVaultSecret, DeletedSecret, SecretProperties
 from .._shared import AsyncKeyVaultClientBase
 from .._shared._polling_async import AsyncDeleteRecoverPollingMethod
@@ -29,6 +32,10 @@ class SecretClient(AsyncKeyVaultClientBase):
     :paramtype api_version: ~azure.keyvault.secrets.ApiVersion or str
     :keyword bool verify_challenge_resource: Whether to verify the authentication challenge resource matches the Key
         Vault domain. Defaults to True.
+    :keyword float cache_ttl: Seconds for which :func:`get_secret` may return a secret it fetched earlier instead of
+        sending a new request. Caching is disabled unless this is set. Secrets this client sets, updates, deletes,
+        restores or recovers are evicted immediately; changes made elsewhere are seen once the TTL lapses.
+    :keyword int cache_maxsize: The maximum number of secrets to cache when ``cache_ttl`` is set. Defaults to 256.
 
     Example:
         .. literalinclude:: ../tests/test_samples_secrets_async.py
@@ -41,6 +48,18 @@ class SecretClient(AsyncKeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    def __init__(
+        self,
+        vault_url: str,
+        credential: AsyncTokenCredential,
+        *,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 256,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(vault_url, credential, **kwargs)
+        self._cache = SecretCache(cache_ttl, cache_maxsize) if cache_ttl is not None else None
+
     @distributed_trace_async
     async def get_secret(self, name: str, version: Optional[str] = None, **kwargs: Any) -> KeyVaultSecret:
         """Get a secret. Requires the secrets/get permission.
@@ -62,8 +81,55 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :caption: Get a secret
                 :dedent: 8
         """
+        generation = 0
+        if self._cache:
+            cached = self._cache.get(name, version)
+            if cached:
+                return cached
+            generation = self._cache.generation(name)
+
         bundle = await self._client.get_secret(name, version or "", **kwargs)
-        return KeyVaultSecret._from_secret_bundle(bundle)
+        secret = KeyVaultSecret._from_secret_bundle(bundle)
+        if self._cache:
+            self._cache.set(name, version, secret, generation)
+        return secret
+
+    @distributed_trace_async
+    async def get_secrets(
+        self, names: Iterable[str], *, max_concurrency: int = 16, **kwargs: Any
+    ) -> List[KeyVaultSecret]:
+        """Get the latest version of several secrets, sending up to ``max_concurrency`` requests at a time. Requires
+        the secrets/get permission.
+
+        :param names: The names of the secrets to get
+        :type names: Iterable[str]
+
+        :keyword int max_concurrency: The maximum number of requests to have in flight at once. Defaults to 16.
+
+        :returns: The fetched secrets, in the order of ``names``.
+        :rtype: list[~azure.keyvault.secrets.KeyVaultSecret]
+
+        :raises ~azure.core.exceptions.ResourceNotFoundError or ~azure.core.exceptions.HttpResponseError:
+            the former if any of the secrets doesn't exist; the latter for other errors
+        :raises ValueError: if ``max_concurrency`` is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_secret(name: str) -> KeyVaultSecret:
+            async with semaphore:
+                return await self.get_secret(name, **kwargs)
+
+        tasks = [asyncio.ensure_future(get_secret(name)) for name in names]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # don't leave the remaining requests running after the first failure
+            for task in tasks:
+                task.cancel()
+            raise
 
     @distributed_trace_async
     async def set_secret(
@@ -122,6 +188,8 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        if self._cache:
+            self._cache.invalidate(name)
         return KeyVaultSecret._from_secret_bundle(bundle)
 
     @distributed_trace_async
@@ -183,6 +251,8 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        if self._cache:
+            self._cache.invalidate(name)
         return SecretProperties._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     @distributed_trace
@@ -281,7 +351,10 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=self._models.SecretRestoreParameters(secret_bundle_backup=backup),
             **kwargs
         )
-        return SecretProperties._from_secret_bundle(bundle)
+        properties = SecretProperties._from_secret_bundle(bundle)
+        if self._cache:
+            self._cache.invalidate(properties.name)
+        return properties
 
     @distributed_trace_async
     async def delete_secret(self, name: str, **kwargs: Any) -> DeletedSecret:
@@ -315,6 +388,8 @@ class SecretClient(AsyncKeyVaultClientBase):
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
         deleted_secret = DeletedSecret._from_deleted_secret_bundle(deleted_secret_bundle)
+        if self._cache:
+            self._cache.invalidate(name)
 
         polling_method = AsyncDeleteRecoverPollingMethod(
             # no recovery ID means soft-delete is disabled, in which case we initialize the poller as finished
@@ -434,6 +509,8 @@ class SecretClient(AsyncKeyVaultClientBase):
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
         recovered_secret = SecretProperties._from_secret_bundle(recovered_secret_bundle)
+        if self._cache:
+            self._cache.invalidate(name)
 
         command = partial(self.get_secret, name=name, **kwargs)
         polling_method = AsyncDeleteRecoverPollingMethod(
@@ -408,3 +408,54 @@ def test_custom_hook_policy():
 
     client = SecretClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+@pytest.mark.asyncio
+async def test_get_secrets():
+    names = ["secret-{}".format(i) for i in range(10)]
+    client = SecretClient("https://localhost", object())
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_secret(name, **kwargs):
+        nonlocal in_flight, max_in_flight
+        assert kwargs == {"logging_enable": True}
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return name
+
+    with patch.object(client, "get_secret", get_secret):
+        assert await client.get_secrets(names, max_concurrency=3, logging_enable=True) == names
+    assert max_in_flight == 3
+
+    with pytest.raises(ValueError):
+        await client.get_secrets(names, max_concurrency=0)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_secret_cache():
+    client = SecretClient("https://localhost", object(), cache_ttl=60)
+    bundle = Mock(id="https://localhost/secrets/secret-name/version", value="value")
+
+    async def get_secret(*_, **__):
+        get_secret.call_count += 1
+        return bundle
+
+    get_secret.call_count = 0
+    with patch.object(client._client, "get_secret", get_secret):
+        first = await client.get_secret("secret-name")
+        second = await client.get_secret("secret-name")
+        assert second is not first and second.value == first.value
+        assert get_secret.call_count == 1
+
+        async def set_secret(*_, **__):
+            return bundle
+
+        with patch.object(client._client, "set_secret", set_secret):
+            await client.set_secret("secret-name", "new-value")
+        await client.get_secret("secret-name")
+        assert get_secret.call_count == 2
+    await client.close()
@@ -5,6 +5,7 @@
 import functools
 import json
 import logging
+import threading
 import time
 from unittest.mock import Mock, patch
 
@@ -396,3 +397,99 @@ def test_custom_hook_policy():
 
     client = SecretClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+def test_get_secrets():
+    names = ["secret-{}".format(i) for i in range(9)]
+    client = SecretClient("https://localhost", object())
+    # each lookup waits for two others to arrive, so this only completes if three run at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_secret(name, **kwargs):
+        assert kwargs == {"logging_enable": True}
+        barrier.wait()
+        return name
+
+    with patch.object(client, "get_secret", Mock(side_effect=get_secret)) as mock_get:
+        assert client.get_secrets(names, max_concurrency=3, logging_enable=True) == names
+    assert mock_get.call_count == len(names)
+
+    with pytest.raises(ValueError):
+        client.get_secrets(names, max_concurrency=0)
+
+
+def test_get_secrets_error():
+    names = ["secret-{}".format(i) for i in range(10)]
+    client = SecretClient("https://localhost", object())
+    release = threading.Event()
+
+    def get_secret(name, **_):
+        if name == names[0]:
+            raise ResourceNotFoundError("...")
+        release.wait(5)
+        return name
+
+    with patch.object(client, "get_secret", Mock(side_effect=get_secret)) as mock_get:
+        with pytest.raises(ResourceNotFoundError):
+            client.get_secrets(names, max_concurrency=2)
+        # the failure surfaced while a lookup was still blocked, and the queued lookups were cancelled
+        assert not release.is_set()
+        release.set()
+    assert mock_get.call_count <= 3
+
+
+def test_get_secret_cache():
+    client = SecretClient("https://localhost", object(), cache_ttl=60)
+    bundle = Mock(id="https://localhost/secrets/secret-name/version", value="value", tags={})
+    with patch.object(client._client, "get_secret", Mock(return_value=bundle)) as mock_get:
+        first = client.get_secret("secret-name")
+        assert client.get_secret("secret-name").value == first.value
+        assert mock_get.call_count == 1
+
+        # a different version is a different cache entry
+        client.get_secret("secret-name", "version")
+        assert mock_get.call_count == 2
+
+        # writes through this client evict every cached version of the secret
+        with patch.object(client._client, "set_secret", Mock(return_value=bundle)):
+            client.set_secret("secret-name", "new-value")
+        client.get_secret("secret-name")
+        client.get_secret("secret-name", "version")
+        assert mock_get.call_count == 4
+
+    # callers get their own copies, so one caller's changes aren't seen by the others
+    cached = client.get_secret("secret-name")
+    assert cached is not first
+    cached.properties.tags["tag"] = "value"
+    assert "tag" not in client.get_secret("secret-name").properties.tags
+
+
+def test_get_secret_cache_write_during_fetch():
+    client = SecretClient("https://localhost", object(), cache_ttl=60)
+    old = Mock(id="https://localhost/secrets/secret-name/version", value="old", tags={})
+    new = Mock(id="https://localhost/secrets/secret-name/version", value="new", tags={})
+
+    def get_secret(*_, **__):
+        # another thread sets the secret while this fetch is in flight
+        with patch.object(client._client, "set_secret", Mock(return_value=new)):
+            client.set_secret("secret-name", "new")
+        return old
+
+    with patch.object(client._client, "get_secret", Mock(side_effect=get_secret)):
+        assert client.get_secret("secret-name").value == "old"
+    # the stale read wasn't cached over the write
+    with patch.object(client._client, "get_secret", Mock(return_value=new)) as mock_get:
+        assert client.get_secret("secret-name").value == "new"
+    assert mock_get.call_count == 1
+
+
+def test_get_secret_cache_disabled_by_default():
+    client = SecretClient("https://localhost", object())
+    bundle = Mock(id="https://localhost/secrets/secret-name/version", value="value")
+    with patch.object(client._client, "get_secret", Mock(return_value=bundle)) as mock_get:
+        client.get_secret("secret-name")
+        client.get_secret("secret-name")
+    assert mock_get.call_count == 2
+
+    with pytest.raises(ValueError):
+        SecretClient("https://localhost", object(), cache_ttl=0)